@@ -2,6 +2,7 @@
 
 import hmalib.common.config as config
 import json
+import orjson
 import typing as t
 
 from dataclasses import dataclass, fields
@@ -29,6 +30,9 @@ class Label:
             return NotImplemented
         return self.key == another_label.key and self.value == another_label.value
 
+    def __hash__(self) -> int:
+        return hash((self.key, self.value))
+
 
 class LabelWithConstraints(Label):
     _KEY_CONSTRAINT = "KeyConstraint"
@@ -40,9 +44,6 @@ class LabelWithConstraints(Label):
 class ActionLabel(LabelWithConstraints):
     _KEY_CONSTRAINT = "Action"
 
-    def __hash__(self) -> int:
-        return self.value.__hash__()
-
 
 class ThreatExchangeReactionLabel(LabelWithConstraints):
     _KEY_CONSTRAINT = "ThreatExchangeReaction"
@@ -58,13 +59,42 @@ class Action:
 @dataclass
 class ActionRule:
     action_label: ActionLabel
-    must_have_labels: t.List[Label]
-    must_not_have_labels: t.List[Label]
+    must_have_labels: t.FrozenSet[Label]
+    must_not_have_labels: t.FrozenSet[Label]
+
+    def __post_init__(self):
+        # Rules are evaluated with set operations, so normalize whatever
+        # collection of labels was passed in
+        self.must_have_labels = frozenset(self.must_have_labels)
+        self.must_not_have_labels = frozenset(self.must_not_have_labels)
 
 
 TUrl = t.Union[t.Text, bytes]
 
 
+def _add_label_to_aws_dict(
+    match_message_dict: t.Dict, label_value_key: str, label: Label
+) -> t.Dict:
+    return {**match_message_dict, label_value_key: label.value}
+
+
+def _aws_messages_from_match_message_and_labels(
+    match_message: MatchMessage, label_value_key: str, labels: t.Sequence[Label]
+) -> t.List[str]:
+    """
+    Equivalent to calling from_match_message_and_label(...).to_aws_message()
+    for each label, but the match message is only converted once and the
+    messages are serialized with orjson.
+    """
+    match_message_dict = match_message.to_aws_dict()
+    return [
+        orjson.dumps(
+            _add_label_to_aws_dict(match_message_dict, label_value_key, label)
+        ).decode()
+        for label in labels
+    ]
+
+
 @dataclass
 class ActionMessage(MatchMessage):
     """
@@ -74,28 +104,26 @@ class ActionMessage(MatchMessage):
     for ActionMessage and MatchMessage.
     """
 
+    LABEL_VALUE_KEY = "ActionLabelValue"
+
     action_label: ActionLabel = ActionLabel("UnspecifiedAction")
 
-    def to_aws_message(self) -> str:
-        return json.dumps(
-            {
-                "ContentKey": self.content_key,
-                "ContentHash": self.content_hash,
-                "MatchingBankedSignals": [
-                    x.to_dict() for x in self.matching_banked_signals
-                ],
-                "ActionLabelValue": self.action_label.value,
-            }
+    def to_aws_dict(self) -> t.Dict:
+        return _add_label_to_aws_dict(
+            super().to_aws_dict(), self.LABEL_VALUE_KEY, self.action_label
         )
 
     @classmethod
     def from_aws_message(cls, message: str) -> "ActionMessage":
-        parsed = json.loads(message)
+        return cls.from_aws_dict(json.loads(message))
+
+    @classmethod
+    def from_aws_dict(cls, parsed: t.Dict) -> "ActionMessage":
         return cls(
             parsed["ContentKey"],
             parsed["ContentHash"],
             [BankedSignal.from_dict(d) for d in parsed["MatchingBankedSignals"]],
-            ActionLabel(parsed["ActionLabelValue"]),
+            ActionLabel(parsed[cls.LABEL_VALUE_KEY]),
         )
 
     @classmethod
@@ -109,6 +137,14 @@ class ActionMessage(MatchMessage):
             action_label,
         )
 
+    @classmethod
+    def aws_messages_from_match_message_and_labels(
+        cls, match_message: MatchMessage, action_labels: t.List[ActionLabel]
+    ) -> t.List[str]:
+        return _aws_messages_from_match_message_and_labels(
+            match_message, cls.LABEL_VALUE_KEY, action_labels
+        )
+
 
 @dataclass
 class ReactionMessage(MatchMessage):
@@ -117,20 +153,15 @@ class ReactionMessage(MatchMessage):
     to the source of the signal (for now, ThreatExchange).
     """
 
+    LABEL_VALUE_KEY = "ReactionLabelValue"
+
     reaction_label: ThreatExchangeReactionLabel = ThreatExchangeReactionLabel(
         "UnspecifiedThreatExchangeReaction"
     )
 
-    def to_aws_message(self) -> str:
-        return json.dumps(
-            {
-                "ContentKey": self.content_key,
-                "ContentHash": self.content_hash,
-                "MatchingBankedSignals": [
-                    x.to_dict() for x in self.matching_banked_signals
-                ],
-                "ReactionLabelValue": self.reaction_label.value,
-            }
+    def to_aws_dict(self) -> t.Dict:
+        return _add_label_to_aws_dict(
+            super().to_aws_dict(), self.LABEL_VALUE_KEY, self.reaction_label
         )
 
     @classmethod
@@ -140,7 +171,7 @@ class ReactionMessage(MatchMessage):
             parsed["ContentKey"],
             parsed["ContentHash"],
             [BankedSignal.from_dict(d) for d in parsed["MatchingBankedSignals"]],
-            ThreatExchangeReactionLabel(parsed["ReactionLabelValue"]),
+            ThreatExchangeReactionLabel(parsed[cls.LABEL_VALUE_KEY]),
         )
 
     @classmethod
@@ -156,6 +187,16 @@ class ReactionMessage(MatchMessage):
             threat_exchange_reaction_label,
         )
 
+    @classmethod
+    def aws_messages_from_match_message_and_labels(
+        cls,
+        match_message: MatchMessage,
+        threat_exchange_reaction_labels: t.List[ThreatExchangeReactionLabel],
+    ) -> t.List[str]:
+        return _aws_messages_from_match_message_and_labels(
+            match_message, cls.LABEL_VALUE_KEY, threat_exchange_reaction_labels
+        )
+
 
 @dataclass
 class ActionPerformer:
@@ -1,7 +1,14 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
 import unittest
-from hmalib.common.actioner_models import Label
+from hmalib.common.actioner_models import (
+    ActionLabel,
+    ActionMessage,
+    Label,
+    ReactionMessage,
+    ThreatExchangeReactionLabel,
+)
+from hmalib.models import BankedSignal, MatchMessage
 
 
 class LabelsTestCase(unittest.TestCase):
@@ -14,3 +21,35 @@ class LabelsTestCase(unittest.TestCase):
         l = Label("some key", "some value")
         serded_l = Label.from_dynamodb_dict(l.to_dynamodb_dict())
         self.assertEqual(l, serded_l)
+
+
+class MessagesTestCase(unittest.TestCase):
+    match_message = MatchMessage(
+        "key", "hash", [BankedSignal("2862392437204724", "bank 4", "te")]
+    )
+
+    def test_action_messages_from_labels(self):
+        action_labels = [ActionLabel("ReviewA"), ActionLabel("ReviewB")]
+        aws_messages = ActionMessage.aws_messages_from_match_message_and_labels(
+            self.match_message, action_labels
+        )
+        self.assertEqual(
+            [ActionMessage.from_aws_message(m) for m in aws_messages],
+            [
+                ActionMessage.from_match_message_and_label(self.match_message, label)
+                for label in action_labels
+            ],
+        )
+
+    def test_reaction_messages_from_labels(self):
+        reaction_labels = [ThreatExchangeReactionLabel("SAW_THIS_TOO")]
+        aws_messages = ReactionMessage.aws_messages_from_match_message_and_labels(
+            self.match_message, reaction_labels
+        )
+        self.assertEqual(
+            [ReactionMessage.from_aws_message(m) for m in aws_messages],
+            [
+                ReactionMessage.from_match_message_and_label(self.match_message, label)
+                for label in reaction_labels
+            ],
+        )
@@ -3,10 +3,15 @@
 import boto3
 import json
 import os
+import time
 import typing as t
 
+from botocore.config import Config
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from functools import lru_cache
+from mypy_boto3_sqs import SQSClient
+from mypy_boto3_sqs.type_defs import SendMessageBatchRequestEntryTypeDef
 from hmalib.common.logging import get_logger
 from hmalib.models import MatchMessage
 from hmalib.common.actioner_models import (
@@ -21,7 +26,20 @@ from hmalib.common.actioner_models import (
 from hmalib.lambdas.actions.action_performer import perform_label_action
 
 logger = get_logger(__name__)
-sqs_client = boto3.client("sqs")
+# botocore>=1.31.81 talks to SQS using the JSON protocol instead of Query/XML.
+# Keepalive lets warm invocations reuse their connections to AWS.
+sqs_client: SQSClient = boto3.client("sqs", config=Config(tcp_keepalive=True))
+lambda_client = boto3.client("lambda", config=Config(tcp_keepalive=True))
+
+# SendMessageBatch accepts at most 10 entries per call
+SQS_MAX_BATCH_SIZE = 10
+SQS_SEND_RETRIES = 2
+# Doubled after every retry
+SQS_RETRY_BACKOFF_SECONDS = 0.1
+
+# Shared across warm invocations; boto3 clients are thread safe and the default
+# connection pool (10) is larger than the number of workers.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
 
 
 @dataclass
@@ -30,14 +48,16 @@ class ActionEvaluatorConfig:
     Simple holder for getting typed environment variables
     """
 
-    actions_queue_url: str
+    __slots__ = ("action_performer_function_name", "reactions_queue_url")
+
+    action_performer_function_name: str
     reactions_queue_url: str
 
     @classmethod
     @lru_cache(maxsize=1)
     def get(cls):
         return cls(
-            actions_queue_url=os.environ["ACTIONS_QUEUE_URL"],
+            action_performer_function_name=os.environ["ACTION_PERFORMER_FUNCTION_NAME"],
             reactions_queue_url=os.environ["REACTIONS_QUEUE_URL"],
         )
 
@@ -48,10 +68,15 @@ def lambda_handler(event, context):
     multiple datasets, this will be called only once.
 
     Action labels are generated for each match message, then an action is performed
-    corresponding to each action label.
+    corresponding to each action label. Actions are handed to the action performer
+    with asynchronous invocations so this lambda does not wait on them, reactions
+    go through the reactions queue.
     """
     config = ActionEvaluatorConfig.get()
 
+    action_message_bodies: t.List[str] = []
+    reaction_message_bodies: t.List[str] = []
+
     for sqs_record in event["Records"]:
         # TODO research max # sqs records / lambda_handler invocation
         sqs_record_body = json.loads(sqs_record["body"])
@@ -60,36 +85,129 @@ def lambda_handler(event, context):
         logger.info("Evaluating match_message: %s", match_message)
 
         action_labels = get_action_labels(match_message)
-        for action_label in action_labels:
-            action_message = ActionMessage.from_match_message_and_label(
-                match_message, action_label
-            )
-            sqs_client.send_message(
-                QueueUrl=config.actions_queue_url,
-                MessageBody=json.dumps(action_message.to_aws_message()),
-            )
+        action_messages = ActionMessage.aws_messages_from_match_message_and_labels(
+            match_message, action_labels
+        )
+        action_message_bodies.extend(action_messages)
 
         if threat_exchange_reacting_is_enabled(match_message):
             threat_exchange_reaction_labels = get_threat_exchange_reaction_labels(
                 match_message, action_labels
             )
             if threat_exchange_reaction_labels:
-                for threat_exchange_reaction_label in threat_exchange_reaction_labels:
-                    threat_exchange_reaction_message = (
-                        ReactionMessage.from_match_message_and_label(
-                            match_message, threat_exchange_reaction_label
-                        )
-                    )
-                    sqs_client.send_message(
-                        QueueUrl=config.reactions_queue_url,
-                        MessageBody=json.dumps(
-                            threat_exchange_reaction_message.to_aws_message()
-                        ),
+                reaction_messages = (
+                    ReactionMessage.aws_messages_from_match_message_and_labels(
+                        match_message, threat_exchange_reaction_labels
                     )
+                )
+                # The reactioner expects the message as a JSON string
+                reaction_message_bodies.extend(json.dumps(m) for m in reaction_messages)
+
+    futures = invoke_action_performer(
+        config.action_performer_function_name, action_message_bodies
+    ) + send_messages_in_batches(config.reactions_queue_url, reaction_message_bodies)
+
+    # Lambda freezes the container once we return, so every call must finish
+    # first. result() re-raises anything that went wrong in a worker.
+    wait(futures)
+    for future in futures:
+        future.result()
 
     return {"evaluation_completed": "true"}
 
 
+class MessageBatchSendError(Exception):
+    """
+    Some messages of a batch could not be sent. Raised through lambda_handler so
+    the invocation fails and SQS redelivers the match messages instead of the
+    reactions being lost.
+    """
+
+
+def invoke_action_performer(
+    function_name: str, action_message_bodies: t.List[str]
+) -> t.List[Future]:
+    """
+    Queues one asynchronous ("Event") invocation of the action performer per
+    action message. Lambda returns as soon as the event is accepted, retries
+    failed invocations itself, and the action performer receives the message
+    (a JSON object) as its event. Events that still fail end up on the action
+    performer's failure destination.
+
+    Invocations are made concurrently on _EXECUTOR, callers must wait on the
+    returned futures.
+    """
+    return [
+        _EXECUTOR.submit(
+            lambda_client.invoke,
+            FunctionName=function_name,
+            InvocationType="Event",
+            Payload=action_message_body.encode(),
+        )
+        for action_message_body in action_message_bodies
+    ]
+
+
+def send_messages_in_batches(
+    queue_url: str, message_bodies: t.List[str]
+) -> t.List[Future]:
+    """
+    Sends message_bodies to queue_url using as few SendMessageBatch calls as
+    possible. Entry ids increase with the position in message_bodies so the
+    original order can be recovered from the responses.
+
+    Batches are sent concurrently on _EXECUTOR, callers must wait on the
+    returned futures.
+    """
+    entries: t.List[SendMessageBatchRequestEntryTypeDef] = [
+        {"Id": str(i), "MessageBody": message_body}
+        for i, message_body in enumerate(message_bodies)
+    ]
+    return [
+        _EXECUTOR.submit(
+            send_message_batch, queue_url, entries[i : i + SQS_MAX_BATCH_SIZE]
+        )
+        for i in range(0, len(entries), SQS_MAX_BATCH_SIZE)
+    ]
+
+
+def send_message_batch(
+    queue_url: str,
+    entries: t.List[SendMessageBatchRequestEntryTypeDef],
+    retries: int = SQS_SEND_RETRIES,
+) -> None:
+    """
+    Sends up to SQS_MAX_BATCH_SIZE entries in a single call. Entries that fail
+    because of an SQS-side error are sent again after a backoff. Raises
+    MessageBatchSendError if an entry is rejected because of the request itself,
+    or still fails once retries run out.
+    """
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(SQS_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+        response = sqs_client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        failures = response.get("Failed", [])
+        if not failures:
+            return
+        if any(failure["SenderFault"] for failure in failures):
+            break
+
+        failed_ids = {failure["Id"] for failure in failures}
+        entries = [entry for entry in entries if entry["Id"] in failed_ids]
+
+    for failure in failures:
+        logger.error(
+            "Failed to send message %s to %s: %s",
+            failure["Id"],
+            queue_url,
+            failure.get("Message", failure["Code"]),
+        )
+    raise MessageBatchSendError(
+        f"Failed to send {len(failures)} message(s) to {queue_url}"
+    )
+
+
 def get_action_labels(match_message: MatchMessage) -> t.List["ActionLabel"]:
     """
     TODO finish implementation
@@ -97,26 +215,31 @@ def get_action_labels(match_message: MatchMessage) -> t.List["ActionLabel"]:
     """
     action_rules = get_action_rules()
     action_labels: t.List["ActionLabel"] = []
+    seen_action_labels: t.Set["ActionLabel"] = set()
     for action_rule in action_rules:
-        if action_rule_applies_to_match_message(
-            action_rule, match_message
-        ) and not action_labels.__contains__(action_rule.action_label):
+        if action_rule.action_label in seen_action_labels:
+            continue
+        if action_rule_applies_to_match_message(action_rule, match_message):
+            seen_action_labels.add(action_rule.action_label)
             action_labels.append(action_rule.action_label)
     action_labels = remove_superseded_actions(action_labels)
     return action_labels
 
 
+@lru_cache(maxsize=1)
 def get_action_rules() -> t.List["ActionRule"]:
     """
     TODO implement
     Returns the ActionRule objects stored in the config repository. Each ActionRule
     will have the following attributes: MustHaveLabels, MustNotHaveLabels, ActionLabel.
+
+    Cached for the lifetime of the container, see _invalidate_config_caches.
     """
     return [
         ActionRule(
             ActionLabel("EnqueueForReview"),
-            [Label("Collaboration", "12345")],
-            [],
+            frozenset({Label("Collaboration", "12345")}),
+            frozenset(),
         )
     ]
 
@@ -132,12 +255,15 @@ def action_rule_applies_to_match_message(
     return True
 
 
+@lru_cache(maxsize=1)
 def get_actions() -> t.List[Action]:
     """
     TODO implement
     Returns the Action objects stored in the config repository. Each Action will have
     the following attributes: ActionLabel, Priority, SupersededByActionLabel (Priority
     and SupersededByActionLabel are used by remove_superseded_actions).
+
+    Cached for the lifetime of the container, see _invalidate_config_caches.
     """
     return [
         Action(
@@ -148,15 +274,29 @@ def get_actions() -> t.List[Action]:
     ]
 
 
+@lru_cache(maxsize=1)
+def get_actions_by_label() -> t.Dict[ActionLabel, Action]:
+    return {action.action_label: action for action in get_actions()}
+
+
 def remove_superseded_actions(
     action_labels: t.List["ActionLabel"],
 ) -> t.List[ActionLabel]:
     """
-    TODO implement
     Evaluates a collection of ActionLabels generated for a match message against the actions.
-    Action labels that are superseded by another will be removed.
+    Action labels that are superseded by another will be removed. Labels without
+    an Action are kept.
     """
-    return action_labels
+    actions_by_label = get_actions_by_label()
+    present_action_labels = set(action_labels)
+    return [
+        action_label
+        for action_label in action_labels
+        if action_label not in actions_by_label
+        or present_action_labels.isdisjoint(
+            actions_by_label[action_label].superseded_by
+        )
+    ]
 
 
 def threat_exchange_reacting_is_enabled(match_message: MatchMessage) -> bool:
@@ -169,6 +309,22 @@ def threat_exchange_reacting_is_enabled(match_message: MatchMessage) -> bool:
     is enabled for a given collaboration, a label will be added to the match message
     (e.g. "ThreatExchangeReactingEnabled:<collaboration-id>").
     """
+    return _threat_exchange_reacting_is_enabled_for_collaborations(
+        frozenset(
+            banked_signal.bank_id
+            for banked_signal in match_message.matching_banked_signals
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _threat_exchange_reacting_is_enabled_for_collaborations(
+    collaboration_ids: t.FrozenSet[str],
+) -> bool:
+    """
+    The config lookup behind threat_exchange_reacting_is_enabled, cached on the
+    collaborations involved rather than on the whole match message.
+    """
     return True
 
 
@@ -184,6 +340,17 @@ def get_threat_exchange_reaction_labels(
     return [ThreatExchangeReactionLabel("SAW_THIS_TOO")]
 
 
+def _invalidate_config_caches() -> None:
+    """
+    Drops every config value cached by this module, so the next match message
+    is evaluated against freshly loaded config.
+    """
+    get_action_rules.cache_clear()
+    get_actions.cache_clear()
+    get_actions_by_label.cache_clear()
+    _threat_exchange_reacting_is_enabled_for_collaborations.cache_clear()
+
+
 if __name__ == "__main__":
     # For basic debugging
     match_message = MatchMessage("key", "hash", [])
@@ -1,6 +1,5 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
-import json
 import typing as t
 from hmalib.common.actioner_models import (
     ActionLabel,
@@ -27,17 +26,14 @@ def perform_label_action(match_message: MatchMessage, action_label: ActionLabel)
 
 def lambda_handler(event, context):
     """
-    This is the main entry point for performing an action. The action evaluator puts
-    an action message on the actions queue and here's where they're popped
-    off and dealt with.
+    This is the main entry point for performing an action. The action evaluator
+    invokes this lambda asynchronously with a single action message as the event.
     """
-    for sqs_record in event["Records"]:
-        # TODO research max # sqs records / lambda_handler invocation
-        action_message = ActionMessage.from_aws_message(json.loads(sqs_record["body"]))
+    action_message = ActionMessage.from_aws_dict(event)
 
-        logger.info("Performing action: action_message = %s", action_message)
+    logger.info("Performing action: action_message = %s", action_message)
 
-        perform_label_action(action_message, action_message.action_label)
+    perform_label_action(action_message, action_message.action_label)
 
     return {"action_performed": "true"}
 
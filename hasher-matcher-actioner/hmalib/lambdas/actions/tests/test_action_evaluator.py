@@ -0,0 +1,187 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import json
+import os
+import unittest
+from unittest import mock
+
+# The module creates its boto3 clients at import time
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from hmalib.common.actioner_models import (
+    Action,
+    ActionLabel,
+    ActionMessage,
+    ActionRule,
+)
+from hmalib.lambdas.actions import action_evaluator
+from hmalib.models import BankedSignal, MatchMessage
+
+
+class ActionEvaluatorTestCase(unittest.TestCase):
+    match_message = MatchMessage(
+        "key",
+        "hash",
+        [BankedSignal("2862392437204724", "12345", "te", ["true_positive"])],
+    )
+
+    # Rules are not evaluated against labels yet, every rule applies
+    action_rules = [
+        ActionRule(ActionLabel("EnqueueForReview"), frozenset(), frozenset()),
+        ActionRule(ActionLabel("Notify"), frozenset(), frozenset()),
+        ActionRule(ActionLabel("EnqueueForReview"), frozenset(), frozenset()),
+        ActionRule(ActionLabel("Delete"), frozenset(), frozenset()),
+    ]
+    actions = [
+        Action(ActionLabel("EnqueueForReview"), 1, [ActionLabel("Delete")]),
+        Action(ActionLabel("Delete"), 2, []),
+    ]
+
+    def setUp(self):
+        action_evaluator._invalidate_config_caches()
+        patcher = mock.patch.object(
+            action_evaluator, "get_action_rules", return_value=self.action_rules
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(action_evaluator._invalidate_config_caches)
+
+    def test_get_action_labels_dedupes_labels(self):
+        with mock.patch.object(action_evaluator, "get_actions", return_value=[]):
+            self.assertEqual(
+                action_evaluator.get_action_labels(self.match_message),
+                [
+                    ActionLabel("EnqueueForReview"),
+                    ActionLabel("Notify"),
+                    ActionLabel("Delete"),
+                ],
+            )
+
+    def test_get_action_labels_removes_superseded_labels(self):
+        with mock.patch.object(
+            action_evaluator, "get_actions", return_value=self.actions
+        ):
+            self.assertEqual(
+                action_evaluator.get_action_labels(self.match_message),
+                [ActionLabel("Notify"), ActionLabel("Delete")],
+            )
+
+    def test_remove_superseded_actions(self):
+        with mock.patch.object(
+            action_evaluator, "get_actions", return_value=self.actions
+        ):
+            self.assertEqual(
+                action_evaluator.remove_superseded_actions(
+                    [
+                        ActionLabel("EnqueueForReview"),
+                        ActionLabel("Notify"),
+                        ActionLabel("Delete"),
+                    ]
+                ),
+                [ActionLabel("Notify"), ActionLabel("Delete")],
+            )
+            self.assertEqual(
+                action_evaluator.remove_superseded_actions(
+                    [ActionLabel("EnqueueForReview")]
+                ),
+                [ActionLabel("EnqueueForReview")],
+            )
+
+
+class SendMessagesTestCase(unittest.TestCase):
+    queue_url = "https://sqs.us-east-1.amazonaws.com/123456789012/reactions"
+
+    def setUp(self):
+        patcher = mock.patch.object(action_evaluator, "sqs_client")
+        self.sqs_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sqs_client.send_message_batch.return_value = {"Successful": []}
+
+        patcher = mock.patch.object(action_evaluator.time, "sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sent_entries(self):
+        return [
+            call.kwargs["Entries"]
+            for call in self.sqs_client.send_message_batch.call_args_list
+        ]
+
+    def test_send_messages_in_batches(self):
+        bodies = [f"message {i}" for i in range(23)]
+        for future in action_evaluator.send_messages_in_batches(self.queue_url, bodies):
+            future.result()
+
+        batches = sorted(self.sent_entries(), key=lambda entries: int(entries[0]["Id"]))
+        self.assertEqual([len(entries) for entries in batches], [10, 10, 3])
+        self.assertEqual(
+            sorted(
+                (int(entry["Id"]), entry["MessageBody"])
+                for entries in batches
+                for entry in entries
+            ),
+            list(enumerate(bodies)),
+        )
+
+    def test_send_message_batch_retries_failed_entries(self):
+        entries = [{"Id": "0", "MessageBody": "a"}, {"Id": "1", "MessageBody": "b"}]
+        self.sqs_client.send_message_batch.side_effect = [
+            {"Failed": [{"Id": "1", "SenderFault": False, "Code": "InternalError"}]},
+            {"Successful": [{"Id": "1"}]},
+        ]
+
+        action_evaluator.send_message_batch(self.queue_url, entries)
+
+        self.assertEqual(self.sent_entries(), [entries, [entries[1]]])
+        self.sleep.assert_called_once_with(action_evaluator.SQS_RETRY_BACKOFF_SECONDS)
+
+    def test_send_message_batch_raises_when_retries_run_out(self):
+        entries = [{"Id": "0", "MessageBody": "a"}]
+        self.sqs_client.send_message_batch.return_value = {
+            "Failed": [{"Id": "0", "SenderFault": False, "Code": "InternalError"}]
+        }
+
+        with self.assertRaises(action_evaluator.MessageBatchSendError):
+            action_evaluator.send_message_batch(self.queue_url, entries, retries=2)
+
+        self.assertEqual(self.sqs_client.send_message_batch.call_count, 3)
+        self.assertEqual(
+            [call.args[0] for call in self.sleep.call_args_list],
+            [
+                action_evaluator.SQS_RETRY_BACKOFF_SECONDS,
+                action_evaluator.SQS_RETRY_BACKOFF_SECONDS * 2,
+            ],
+        )
+
+    def test_send_message_batch_raises_on_sender_fault(self):
+        entries = [{"Id": "0", "MessageBody": "a"}]
+        self.sqs_client.send_message_batch.return_value = {
+            "Failed": [{"Id": "0", "SenderFault": True, "Code": "InvalidMessage"}]
+        }
+
+        with self.assertRaises(action_evaluator.MessageBatchSendError):
+            action_evaluator.send_message_batch(self.queue_url, entries)
+
+        self.sqs_client.send_message_batch.assert_called_once()
+        self.sleep.assert_not_called()
+
+
+class InvokeActionPerformerTestCase(unittest.TestCase):
+    def test_invoke_action_performer_sends_message_as_payload(self):
+        (message,) = ActionMessage.aws_messages_from_match_message_and_labels(
+            ActionEvaluatorTestCase.match_message, [ActionLabel("EnqueueForReview")]
+        )
+
+        with mock.patch.object(action_evaluator, "lambda_client") as lambda_client:
+            for future in action_evaluator.invoke_action_performer(
+                "action_performer", [message]
+            ):
+                future.result()
+
+        lambda_client.invoke.assert_called_once()
+        kwargs = lambda_client.invoke.call_args.kwargs
+        self.assertEqual(kwargs["InvocationType"], "Event")
+        self.assertEqual(
+            ActionMessage.from_aws_dict(json.loads(kwargs["Payload"])),
+            ActionMessage.from_aws_message(message),
+        )
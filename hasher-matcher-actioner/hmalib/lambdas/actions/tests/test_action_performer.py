@@ -0,0 +1,35 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import json
+import unittest
+from unittest import mock
+
+from hmalib.common.actioner_models import ActionLabel, ActionMessage
+from hmalib.lambdas.actions import action_performer
+from hmalib.models import BankedSignal, MatchMessage
+
+
+class ActionPerformerTestCase(unittest.TestCase):
+    def test_lambda_handler_takes_action_message_as_event(self):
+        match_message = MatchMessage(
+            "key",
+            "hash",
+            [BankedSignal("2862392437204724", "12345", "te", ["true_positive"])],
+        )
+        (message,) = ActionMessage.aws_messages_from_match_message_and_labels(
+            match_message, [ActionLabel("EnqueueForReview")]
+        )
+
+        with mock.patch.object(
+            action_performer, "perform_label_action"
+        ) as perform_label_action:
+            # Lambda hands an asynchronous invocation's payload over parsed
+            result = action_performer.lambda_handler(json.loads(message), None)
+
+        self.assertEqual(result, {"action_performed": "true"})
+        perform_label_action.assert_called_once_with(
+            ActionMessage.from_match_message_and_label(
+                match_message, ActionLabel("EnqueueForReview")
+            ),
+            ActionLabel("EnqueueForReview"),
+        )
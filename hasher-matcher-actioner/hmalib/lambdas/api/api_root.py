@@ -280,8 +280,8 @@ def get_count_from_record_cls(record_cls: t.Type[PDQRecordBase]) -> DashboardCou
     now = datetime.datetime.now()
     day_ago = now - datetime.timedelta(1)
     table = dynamodb.Table(DYNAMODB_TABLE)
-    total_count = len(record_cls.get_from_time_range(table))
-    today_count = len(record_cls.get_from_time_range(table, day_ago.isoformat()))
+    total_count = record_cls.get_count_from_time_range(table)
+    today_count = record_cls.get_count_from_time_range(table, day_ago.isoformat())
     return DashboardCount(
         total=total_count,
         today=today_count,
@@ -1,18 +1,33 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
 import bottle
-from dataclasses import dataclass, asdict
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from mypy_boto3_dynamodb.service_resource import Table
 import typing as t
 from enum import Enum
 from threatexchange.descriptor import ThreatDescriptor
 
 from hmalib.models import PDQMatchRecord, PDQSignalMetadata
-from .middleware import jsoninator, JSONifiable
+from .middleware import jsoninator, gzipinator, JSONifiable
+
+TSignal = t.Tuple[t.Union[str, int], str]
+
+# Match summaries returned by the matches API unless a limit is given, and the
+# most it returns. Lambda responses can't be larger than 6MB.
+DEFAULT_MATCHES_LIMIT = 500
+MAX_MATCHES_LIMIT = 5000
+
+# The response dataclasses below are created once per returned row, so they
+# declare __slots__ by hand (dataclass(slots=True) needs python 3.10).
 
 
 @dataclass
 class MatchSummary(JSONifiable):
+    __slots__ = ("content_id", "signal_id", "signal_source", "updated_at", "reactions")
+
     content_id: str
     signal_id: t.Union[str, int]
     signal_source: str
@@ -20,31 +35,59 @@ class MatchSummary(JSONifiable):
     reactions: str
 
     def to_json(self) -> t.Dict:
-        return asdict(self)
+        return {
+            "content_id": self.content_id,
+            "signal_id": self.signal_id,
+            "signal_source": self.signal_source,
+            "updated_at": self.updated_at,
+            "reactions": self.reactions,
+        }
 
 
 @dataclass
 class MatchSummariesResponse(JSONifiable):
+    __slots__ = ("match_summaries", "truncated")
+
     match_summaries: t.List[MatchSummary]
+    # True if more matches than were returned exist
+    truncated: bool
 
     def to_json(self) -> t.Dict:
         return {
-            "match_summaries": [summary.to_json() for summary in self.match_summaries]
+            "match_summaries": [summary.to_json() for summary in self.match_summaries],
+            "truncated": self.truncated,
         }
 
 
 @dataclass
 class MatchDetailMetadata(JSONifiable):
+    __slots__ = ("dataset", "tags", "opinion")
+
     dataset: str
     tags: t.List[str]
     opinion: str
 
     def to_json(self) -> t.Dict:
-        return asdict(self)
+        return {
+            "dataset": self.dataset,
+            "tags": self.tags,
+            "opinion": self.opinion,
+        }
 
 
 @dataclass
 class MatchDetail(JSONifiable):
+    __slots__ = (
+        "content_id",
+        "content_hash",
+        "signal_id",
+        "signal_hash",
+        "signal_source",
+        "signal_type",
+        "updated_at",
+        "metadata",
+    )
+
     content_id: str
     content_hash: str
     signal_id: t.Union[str, int]
@@ -55,13 +98,22 @@ class MatchDetail(JSONifiable):
     metadata: t.List[MatchDetailMetadata]
 
     def to_json(self) -> t.Dict:
-        result = asdict(self)
-        result.update(metadata=[datum.to_json() for datum in self.metadata])
-        return result
+        return {
+            "content_id": self.content_id,
+            "content_hash": self.content_hash,
+            "signal_id": self.signal_id,
+            "signal_hash": self.signal_hash,
+            "signal_source": self.signal_source,
+            "signal_type": self.signal_type,
+            "updated_at": self.updated_at,
+            "metadata": [datum.to_json() for datum in self.metadata],
+        }
 
 
 @dataclass
 class MatchDetailsResponse(JSONifiable):
+    __slots__ = ("match_details",)
+
     match_details: t.List[MatchDetail]
 
     def to_json(self) -> t.Dict:
@@ -77,46 +129,116 @@ def get_match_details(
     records = PDQMatchRecord.get_from_content_id(
         table, f"{image_folder_key}{content_id}"
     )
+    # One lookup per distinct signal for the whole response, not one per record.
+    # (Match records are keyed on content and signal, so within one content_id
+    # each signal shows up once anyway.)
+    signal_metadata = get_signal_metadata(
+        table,
+        (
+            (record.signal_id, record.signal_source)
+            for record in records
+            if record.signal_id and record.signal_source
+        ),
+    )
 
+    # str.removeprefix is python 3.9+, records are always under image_folder_key
+    prefix_len = len(image_folder_key)
     return [
         MatchDetail(
-            content_id=record.content_id[len(image_folder_key) :],
+            content_id=record.content_id[prefix_len:],
             content_hash=record.content_hash,
             signal_id=record.signal_id,
             signal_hash=record.signal_hash,
             signal_source=record.signal_source,
             signal_type=record.SIGNAL_TYPE,
             updated_at=record.updated_at.isoformat(),
-            metadata=get_signal_details(table, record.signal_id, record.signal_source),
+            metadata=to_match_detail_metadata(
+                signal_metadata.get((record.signal_id, record.signal_source), [])
+            ),
         )
         for record in records
     ]
 
 
-def get_signal_details(
-    table: Table, signal_id: t.Union[str, int], signal_source: str
-) -> t.List[MatchDetailMetadata]:
-    if not signal_id or not signal_source:
-        return []
+class SignalMetadataCache:
+    """
+    A size bounded LRU cache of PDQSignalMetadata by (signal_id, signal_source)
+    whose entries expire after ttl_seconds. Signal metadata changes on the order
+    of hours, but the UI can ask for the same match details far more often than
+    that.
 
+    The table is not part of the key, a lambda only ever reads from one. Not
+    thread safe, bottle serves one request at a time here.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # signal -> (time fetched, metadata), least recently used first
+        self._entries: t.OrderedDict[
+            TSignal, t.Tuple[float, t.List[PDQSignalMetadata]]
+        ] = OrderedDict()
+
+    def get(self, signal: TSignal) -> t.Optional[t.List[PDQSignalMetadata]]:
+        entry = self._entries.get(signal)
+        if entry is None:
+            return None
+        fetched_at, metadata = entry
+        if time.monotonic() - fetched_at >= self.ttl_seconds:
+            del self._entries[signal]
+            return None
+        self._entries.move_to_end(signal)
+        return metadata
+
+    def put(self, signal: TSignal, metadata: t.List[PDQSignalMetadata]) -> None:
+        self._entries[signal] = (time.monotonic(), metadata)
+        self._entries.move_to_end(signal)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+_signal_metadata_cache = SignalMetadataCache(ttl_seconds=60, max_size=10_000)
+
+
+def get_signal_metadata(
+    table: Table, signals: t.Iterable[TSignal]
+) -> t.Dict[TSignal, t.List[PDQSignalMetadata]]:
+    """
+    PDQSignalMetadata.get_from_signals, but only signals that are not in
+    _signal_metadata_cache are read from the table.
+
+    Signals without metadata are not cached, the matcher may be about to write
+    it.
+    """
+    signal_metadata: t.Dict[TSignal, t.List[PDQSignalMetadata]] = {}
+    uncached_signals = []
+    for signal in signals:
+        metadata = _signal_metadata_cache.get(signal)
+        if metadata is None:
+            uncached_signals.append(signal)
+        else:
+            signal_metadata[signal] = metadata
+
+    fetched = PDQSignalMetadata.get_from_signals(table, uncached_signals)
+    for signal, metadata in fetched.items():
+        if metadata:
+            _signal_metadata_cache.put(signal, metadata)
+    signal_metadata.update(fetched)
+    return signal_metadata
+
+
+def to_match_detail_metadata(
+    signal_metadata: t.List[PDQSignalMetadata],
+) -> t.List[MatchDetailMetadata]:
     return [
         MatchDetailMetadata(
             dataset=metadata.ds_id,
-            tags=[
-                tag
-                for tag in metadata.tags
-                if tag
-                not in [
-                    ThreatDescriptor.TRUE_POSITIVE,
-                    ThreatDescriptor.FALSE_POSITIVE,
-                    ThreatDescriptor.DISPUTED,
-                ]
-            ],
-            opinion=get_opinion_from_tags(metadata.tags).value,
-        )
-        for metadata in PDQSignalMetadata.get_from_signal(
-            table, signal_id, signal_source
+            tags=[tag for tag in metadata.tags if tag not in OPINION_TAGS],
+            opinion=get_opinion_from_tags(
+                OPINION_TAGS.intersection(metadata.tags)
+            ).value,
         )
+        for metadata in signal_metadata
     ]
 
 
@@ -127,17 +249,42 @@ class OpinionString(Enum):
     UNKNOWN = "Unknown"
 
 
-def get_opinion_from_tags(tags: t.List[str]) -> OpinionString:
-    # see python-threatexchange descriptor.py for origins
-    if ThreatDescriptor.TRUE_POSITIVE in tags:
-        return OpinionString.TP
-    if ThreatDescriptor.FALSE_POSITIVE in tags:
-        return OpinionString.FP
-    if ThreatDescriptor.DISPUTED in tags:
-        return OpinionString.DISPUTED
+# see python-threatexchange descriptor.py for origins
+# Highest priority first, a true positive wins over everything else
+OPINIONS_BY_TAG = [
+    (ThreatDescriptor.TRUE_POSITIVE, OpinionString.TP),
+    (ThreatDescriptor.FALSE_POSITIVE, OpinionString.FP),
+    (ThreatDescriptor.DISPUTED, OpinionString.DISPUTED),
+]
+
+# Tags that carry an opinion rather than describe the signal, they are surfaced
+# as MatchDetailMetadata.opinion instead of tags.
+OPINION_TAGS = frozenset(tag for tag, _ in OPINIONS_BY_TAG)
+
+
+def get_opinion_from_tags(tags: t.Collection[str]) -> OpinionString:
+    tag_set = tags if isinstance(tags, (set, frozenset)) else set(tags)
+    for tag, opinion in OPINIONS_BY_TAG:
+        if tag in tag_set:
+            return opinion
     return OpinionString.UNKNOWN
 
 
+def get_limit(limit_q: str) -> int:
+    """
+    Parses the limit query param of the matches API.
+    """
+    if not limit_q:
+        return DEFAULT_MATCHES_LIMIT
+    try:
+        limit = int(limit_q)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        bottle.abort(400, "limit must be a positive integer")
+    return min(limit, MAX_MATCHES_LIMIT)
+
+
 def get_matches_api(dynamodb_table: Table, image_folder_key: str) -> bottle.Bottle:
     """
     A Closure that includes all dependencies that MUST be provided by the root
@@ -148,16 +295,22 @@ def get_matches_api(dynamodb_table: Table, image_folder_key: str) -> bottle.Bott
     # A prefix to all routes must be provided by the api_root app
     # The documentation below expects prefix to be '/matches/'
     matches_api = bottle.Bottle()
+    # Match lists can run to hundreds of KB of JSON
+    matches_api.install(gzipinator)
 
     @matches_api.get("/", apply=[jsoninator])
     def matches() -> MatchSummariesResponse:
         """
-        Returns all, or a filtered list of matches.
+        Returns all, or a filtered list of matches. At most `limit` (default
+        DEFAULT_MATCHES_LIMIT, at most MAX_MATCHES_LIMIT) matches are returned,
+        `truncated` tells whether there were more.
         """
         signal_q = bottle.request.query.signal_q or None
         signal_source = bottle.request.query.signal_source or None
         content_q = bottle.request.query.content_q or None
+        limit = get_limit(bottle.request.query.limit)
 
+        records: t.Iterable[PDQMatchRecord]
         if content_q:
             records = PDQMatchRecord.get_from_content_id(dynamodb_table, content_q)
         elif signal_q:
@@ -167,17 +320,23 @@ def get_matches_api(dynamodb_table: Table, image_folder_key: str) -> bottle.Bott
         else:
             records = PDQMatchRecord.get_from_time_range(dynamodb_table)
 
+        prefix_len = len(image_folder_key)
+        records_iter = iter(records)
+        match_summaries = [
+            MatchSummary(
+                content_id=record.content_id[prefix_len:],
+                signal_id=record.signal_id,
+                signal_source=record.signal_source,
+                updated_at=record.updated_at.isoformat(),
+                reactions="Mocked",
+            )
+            # Stops reading from the table once limit records were read
+            for record in itertools.islice(records_iter, limit)
+        ]
+        # Reads at most one more record to tell if there were more
+        truncated = next(records_iter, None) is not None
         return MatchSummariesResponse(
-            match_summaries=[
-                MatchSummary(
-                    content_id=record.content_id[len(image_folder_key) :],
-                    signal_id=record.signal_id,
-                    signal_source=record.signal_source,
-                    updated_at=record.updated_at.isoformat(),
-                    reactions="Mocked",
-                )
-                for record in records
-            ]
+            match_summaries=match_summaries, truncated=truncated
         )
 
     @matches_api.get("/match/<key>/", apply=[jsoninator])
@@ -1,8 +1,9 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
 
-import json
+import gzip
+import orjson
 import typing as t
-from bottle import response, install
+from bottle import request, response, install
 
 """
 Inspired by Java's JAX-RS standards and perhaps most sane web frameworks. Allows
@@ -28,6 +29,9 @@ Sample usage:
 
 
 class JSONifiable:
+    # Empty so that subclasses declaring __slots__ don't get a __dict__ anyway
+    __slots__ = ()
+
     def to_json(self) -> t.Dict:
         raise NotImplementedError
 
@@ -40,11 +44,60 @@ def jsoninator(view_fn: t.Callable[[int, int], JSONifiable]):
     content_type header will be automatically set, but if you need to set
     anything else, eg. status code or other headers, continue to use
     `bottle.response`.
+
+    Bodies are serialized with orjson, which is considerably faster than the
+    json module for large responses and produces the UTF-8 bytes bottle sends.
     """
 
     def wrapper(*args, **kwargs):
         body = view_fn(*args, **kwargs)
         response.content_type = "application/json"
-        return json.dumps(body.to_json())
+        return orjson.dumps(body.to_json(), option=orjson.OPT_NON_STR_KEYS)
+
+    return wrapper
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header value allows gzip, eg. "deflate, gzip",
+    "*" but not "gzip;q=0". Unparseable q-values count as q=0.
+    """
+    qualities: t.Dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def gzipinator(view_fn: t.Callable):
+    """
+    Bottle plugin which gzips byte bodies (eg. from jsoninator) for clients that
+    accept it. Install it on the app so it wraps the views' own plugins:
+
+    >>> app.install(gzipinator)
+
+    Level 1 costs little CPU and still shrinks JSON considerably. apig_wsgi
+    base64 encodes gzip bodies for API Gateway.
+    """
+
+    def wrapper(*args, **kwargs):
+        body = view_fn(*args, **kwargs)
+        if not isinstance(body, bytes):
+            return body
+
+        response.add_header("Vary", "Accept-Encoding")
+        if not _accepts_gzip(request.headers.get("Accept-Encoding", "")):
+            return body
+
+        response.set_header("Content-Encoding", "gzip")
+        return gzip.compress(body, compresslevel=1)
 
     return wrapper
@@ -0,0 +1,228 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import bottle
+import dataclasses
+import datetime
+import itertools
+import json
+import unittest
+from unittest import mock
+
+from hmalib.lambdas.api import matches
+from hmalib.models import PDQMatchRecord, PDQSignalMetadata
+from hmalib.lambdas.api.tests.utils import call_wsgi_app
+
+SIGNAL = ("2862392437204724", "te")
+OTHER_SIGNAL = ("4194946153908639", "te")
+
+
+def get_example_signal_metadata(tags=("true_positive",)):
+    return [
+        PDQSignalMetadata(
+            SIGNAL[0],
+            "258601789084078",
+            datetime.datetime(2021, 4, 1),
+            SIGNAL[1],
+            "facefacefacefacefacefacefacefacefacefacefacefacefacefacefaceface",
+            list(tags),
+        )
+    ]
+
+
+class SignalMetadataCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(matches.time, "monotonic", return_value=1000.0)
+        self.monotonic = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_returns_put_metadata(self):
+        cache = matches.SignalMetadataCache(ttl_seconds=60, max_size=10)
+        metadata = get_example_signal_metadata()
+
+        cache.put(SIGNAL, metadata)
+
+        self.assertIs(cache.get(SIGNAL), metadata)
+        self.assertIsNone(cache.get(OTHER_SIGNAL))
+
+    def test_entries_expire_after_ttl(self):
+        cache = matches.SignalMetadataCache(ttl_seconds=60, max_size=10)
+        metadata = get_example_signal_metadata()
+        cache.put(SIGNAL, metadata)
+
+        self.monotonic.return_value = 1059.0
+        self.assertIs(cache.get(SIGNAL), metadata)
+
+        self.monotonic.return_value = 1060.0
+        self.assertIsNone(cache.get(SIGNAL))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = matches.SignalMetadataCache(ttl_seconds=60, max_size=2)
+        third_signal = ("1234567890", "te")
+        cache.put(SIGNAL, [])
+        cache.put(OTHER_SIGNAL, [])
+
+        # Reading SIGNAL makes OTHER_SIGNAL the least recently used
+        cache.get(SIGNAL)
+        cache.put(third_signal, [])
+
+        self.assertIsNotNone(cache.get(SIGNAL))
+        self.assertIsNone(cache.get(OTHER_SIGNAL))
+        self.assertIsNotNone(cache.get(third_signal))
+
+
+class GetSignalMetadataTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            matches,
+            "_signal_metadata_cache",
+            matches.SignalMetadataCache(ttl_seconds=60, max_size=10),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(PDQSignalMetadata, "get_from_signals")
+        self.get_from_signals = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_signals_are_not_read_from_the_table(self):
+        metadata = get_example_signal_metadata()
+        self.get_from_signals.return_value = {SIGNAL: metadata}
+        self.assertEqual(
+            matches.get_signal_metadata(None, [SIGNAL]), {SIGNAL: metadata}
+        )
+
+        self.get_from_signals.return_value = {OTHER_SIGNAL: []}
+        self.assertEqual(
+            matches.get_signal_metadata(None, [SIGNAL, OTHER_SIGNAL]),
+            {SIGNAL: metadata, OTHER_SIGNAL: []},
+        )
+        self.get_from_signals.assert_called_with(None, [OTHER_SIGNAL])
+
+    def test_signals_without_metadata_are_not_cached(self):
+        self.get_from_signals.return_value = {SIGNAL: []}
+        matches.get_signal_metadata(None, [SIGNAL])
+        matches.get_signal_metadata(None, [SIGNAL])
+
+        self.assertEqual(self.get_from_signals.call_count, 2)
+        self.get_from_signals.assert_called_with(None, [SIGNAL])
+
+
+class ToJsonTestCase(unittest.TestCase):
+    """
+    to_json is written out by hand, it must stay equivalent to dataclasses.asdict
+    """
+
+    metadata = matches.MatchDetailMetadata("258601789084078", ["media_type"], "Unknown")
+    detail = matches.MatchDetail(
+        content_id="image.jpg",
+        content_hash="facefacefacefacefacefacefacefacefacefacefacefacefacefacefaceface",
+        signal_id="2862392437204724",
+        signal_hash="facefacefacefacefacefacefacefacefacefacefacefacefacefacefaceface",
+        signal_source="te",
+        signal_type="pdq",
+        updated_at="2021-04-01T00:00:00",
+        metadata=[metadata],
+    )
+    summary = matches.MatchSummary(
+        content_id="image.jpg",
+        signal_id="2862392437204724",
+        signal_source="te",
+        updated_at="2021-04-01T00:00:00",
+        reactions="Mocked",
+    )
+
+    def test_to_json_matches_asdict(self):
+        for jsonifiable in [
+            self.metadata,
+            self.detail,
+            matches.MatchDetailsResponse([self.detail]),
+            self.summary,
+            matches.MatchSummariesResponse([self.summary], truncated=False),
+        ]:
+            with self.subTest(jsonifiable=type(jsonifiable).__name__):
+                self.assertEqual(jsonifiable.to_json(), dataclasses.asdict(jsonifiable))
+
+
+class ToMatchDetailMetadataTestCase(unittest.TestCase):
+    def test_opinion_tags_are_moved_out_of_tags(self):
+        (metadata,) = matches.to_match_detail_metadata(
+            get_example_signal_metadata(
+                tags=["media_type_photo", "true_positive", "disputed", "hma_test"]
+            )
+        )
+
+        self.assertEqual(metadata.dataset, "258601789084078")
+        self.assertEqual(metadata.tags, ["media_type_photo", "hma_test"])
+        self.assertEqual(metadata.opinion, matches.OpinionString.TP.value)
+
+
+class GetOpinionFromTagsTestCase(unittest.TestCase):
+    def test_opinion_precedence(self):
+        cases = [
+            (["true_positive", "false_positive", "disputed"], matches.OpinionString.TP),
+            (["disputed", "false_positive"], matches.OpinionString.FP),
+            (["disputed"], matches.OpinionString.DISPUTED),
+            (["media_type_photo"], matches.OpinionString.UNKNOWN),
+            ([], matches.OpinionString.UNKNOWN),
+        ]
+        for tags, opinion in cases:
+            with self.subTest(tags=tags):
+                self.assertEqual(matches.get_opinion_from_tags(tags), opinion)
+                self.assertEqual(matches.get_opinion_from_tags(set(tags)), opinion)
+
+
+class MatchesLimitTestCase(unittest.TestCase):
+    def setUp(self):
+        # None never ends, like a large enough table
+        self.table_size = None
+
+        def get_from_time_range(table):
+            for i in itertools.islice(itertools.count(), self.table_size):
+                yield PDQMatchRecord(
+                    f"images/{i}.jpg",
+                    "hash",
+                    datetime.datetime(2021, 4, 1),
+                    str(i),
+                    "te",
+                    "signal_hash",
+                )
+
+        patcher = mock.patch.object(
+            PDQMatchRecord, "get_from_time_range", side_effect=get_from_time_range
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app = matches.get_matches_api(None, "images/")
+
+    def get_response(self, query_string=""):
+        status, _, body = call_wsgi_app(self.app, "/", query_string)
+        self.assertEqual(status, "200 OK")
+        return json.loads(body)
+
+    def get_match_summaries(self, query_string=""):
+        return self.get_response(query_string)["match_summaries"]
+
+    def test_default_limit(self):
+        summaries = self.get_match_summaries()
+        self.assertEqual(len(summaries), matches.DEFAULT_MATCHES_LIMIT)
+        self.assertEqual(summaries[0]["content_id"], "0.jpg")
+
+    def test_limit(self):
+        self.assertEqual(len(self.get_match_summaries("limit=3")), 3)
+        self.assertEqual(
+            len(self.get_match_summaries(f"limit={matches.MAX_MATCHES_LIMIT + 1}")),
+            matches.MAX_MATCHES_LIMIT,
+        )
+
+    def test_truncated(self):
+        self.assertTrue(self.get_response("limit=3")["truncated"])
+        self.table_size = 3
+        self.assertFalse(self.get_response("limit=3")["truncated"])
+        self.table_size = 4
+        self.assertTrue(self.get_response("limit=3")["truncated"])
+
+    def test_invalid_limit(self):
+        for limit in ["0", "-1", "many"]:
+            with self.subTest(limit=limit):
+                status, _, _ = call_wsgi_app(self.app, "/", f"limit={limit}")
+                self.assertEqual(status, "400 Bad Request")
@@ -0,0 +1,95 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import bottle
+import gzip
+import json
+import typing as t
+import unittest
+from dataclasses import dataclass
+
+from hmalib.lambdas.api.middleware import (
+    _accepts_gzip,
+    gzipinator,
+    jsoninator,
+    JSONifiable,
+)
+from hmalib.lambdas.api.tests.utils import call_wsgi_app
+
+
+@dataclass
+class CupcakesResponse(JSONifiable):
+    num_cupcakes: int
+
+    def to_json(self) -> t.Dict:
+        return {"num_cupcakes": self.num_cupcakes}
+
+
+class AcceptsGzipTestCase(unittest.TestCase):
+    def test_accepts_gzip(self):
+        for accept_encoding, accepted in [
+            ("", False),
+            ("gzip", True),
+            ("deflate, gzip", True),
+            ("GZIP;q=0.5", True),
+            ("*", True),
+            ("br, *;q=0.1", True),
+            ("deflate", False),
+            ("gzip;q=0", False),
+            ("gzip; q=0.0, deflate", False),
+            ("gzip;q=0, *", False),
+            ("gzip;q=oops", False),
+            ("x-gzip", False),
+        ]:
+            with self.subTest(accept_encoding=accept_encoding):
+                self.assertEqual(_accepts_gzip(accept_encoding), accepted)
+
+
+class GzipinatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.app = bottle.Bottle()
+        self.app.install(gzipinator)
+
+        @self.app.get("/json", apply=[jsoninator])
+        def get_json() -> CupcakesResponse:
+            return CupcakesResponse(12)
+
+        @self.app.get("/text")
+        def get_text() -> str:
+            return "twelve cupcakes"
+
+    def test_gzips_when_accepted(self):
+        status, headers, body = call_wsgi_app(
+            self.app, "/json", headers={"HTTP_ACCEPT_ENCODING": "deflate, gzip"}
+        )
+
+        self.assertEqual(status, "200 OK")
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+        self.assertEqual(json.loads(gzip.decompress(body)), {"num_cupcakes": 12})
+
+    def test_does_not_gzip_when_not_accepted(self):
+        status, headers, body = call_wsgi_app(self.app, "/json")
+
+        self.assertEqual(status, "200 OK")
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+        self.assertEqual(json.loads(body), {"num_cupcakes": 12})
+
+    def test_does_not_gzip_when_refused(self):
+        status, headers, body = call_wsgi_app(
+            self.app, "/json", headers={"HTTP_ACCEPT_ENCODING": "gzip;q=0"}
+        )
+
+        self.assertEqual(status, "200 OK")
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(json.loads(body), {"num_cupcakes": 12})
+
+    def test_non_bytes_bodies_pass_through(self):
+        status, headers, body = call_wsgi_app(
+            self.app, "/text", headers={"HTTP_ACCEPT_ENCODING": "gzip"}
+        )
+
+        self.assertEqual(status, "200 OK")
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertNotIn("Vary", headers)
+        self.assertEqual(body, b"twelve cupcakes")
@@ -0,0 +1,27 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import io
+
+
+def call_wsgi_app(app, path, query_string="", headers=None):
+    """
+    Returns the status, headers and body of a GET request to a bottle app.
+    """
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query_string,
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+    }
+    environ.update(headers or {})
+    response = {}
+
+    def start_response(status, response_headers, exc_info=None):
+        response["status"] = status
+        response["headers"] = dict(response_headers)
+
+    body = b"".join(app(environ, start_response))
+    return response["status"], response["headers"], body
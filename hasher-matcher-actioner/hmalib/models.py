@@ -3,7 +3,9 @@
 import datetime
 import typing as t
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from mypy_boto3_dynamodb import DynamoDBClient
 from mypy_boto3_dynamodb.service_resource import Table
 from boto3.dynamodb.conditions import Attr, Key, And
 from botocore.exceptions import ClientError
@@ -92,6 +94,9 @@ class PDQSignalMetadata(SignalMetadataBase):
     """
 
     SIGNAL_TYPE = "pdq"
+    # Queries are I/O bound, but there is no point in having more in flight than
+    # the connection pool of the underlying client (10 by default) can serve.
+    MAX_CONCURRENT_QUERIES = 10
 
     def to_dynamodb_item(self) -> dict:
         return {
@@ -143,17 +148,70 @@ class PDQSignalMetadata(SignalMetadataBase):
         signal_id: t.Union[str, int],
         signal_source: str,
     ) -> t.List["PDQSignalMetadata"]:
+        return cls._query_signal(
+            t.cast(DynamoDBClient, table.meta.client),
+            table.name,
+            signal_id,
+            signal_source,
+        )
 
-        items = table.query(
-            KeyConditionExpression=Key("PK").eq(
+    @classmethod
+    def _query_signal(
+        cls,
+        client: DynamoDBClient,
+        table_name: str,
+        signal_id: t.Union[str, int],
+        signal_source: str,
+    ) -> t.List["PDQSignalMetadata"]:
+        """
+        Queries through the table's client: unlike Table resources, clients are
+        thread safe. The client of a resource still accepts conditions and
+        returns python values.
+        """
+        items = client.query(
+            TableName=table_name,
+            KeyConditionExpression=Key("PK").eq(  # type: ignore
                 cls.get_dynamodb_signal_key(signal_source, signal_id)
             )
             & Key("SK").begins_with(cls.DATASET_PREFIX),
             ProjectionExpression="PK, ContentHash, UpdatedAt, SK, SignalSource, SignalHash, Tags",
-            FilterExpression=Attr("HashType").eq(cls.SIGNAL_TYPE),
+            FilterExpression=Attr("HashType").eq(cls.SIGNAL_TYPE),  # type: ignore
         ).get("Items", [])
         return cls._result_items_to_metadata(items)
 
+    @classmethod
+    def get_from_signals(
+        cls,
+        table: Table,
+        signals: t.Iterable[t.Tuple[t.Union[str, int], str]],
+    ) -> t.Dict[t.Tuple[t.Union[str, int], str], t.List["PDQSignalMetadata"]]:
+        """
+        Given (signal_id, signal_source) pairs, returns the metadata of each
+        distinct pair. Metadata items are keyed on signal and dataset, and callers
+        don't know the datasets, so BatchGetItem can't be used; each signal is
+        queried exactly once instead, with the queries running concurrently.
+        """
+        distinct_signals = list(set(signals))
+        if len(distinct_signals) <= 1:
+            return {
+                (signal_id, signal_source): cls.get_from_signal(
+                    table, signal_id, signal_source
+                )
+                for signal_id, signal_source in distinct_signals
+            }
+
+        # Boto3 resources are not thread safe, workers only share the client
+        client = t.cast(DynamoDBClient, table.meta.client)
+        table_name = table.name
+        with ThreadPoolExecutor(
+            max_workers=min(len(distinct_signals), cls.MAX_CONCURRENT_QUERIES)
+        ) as executor:
+            metadata = executor.map(
+                lambda signal: cls._query_signal(client, table_name, *signal),
+                distinct_signals,
+            )
+            return dict(zip(distinct_signals, metadata))
+
     @classmethod
     def _result_items_to_metadata(
         cls,
@@ -195,9 +253,19 @@ class PDQRecordBase(DynamoDBItem):
     @classmethod
     def get_from_time_range(
         cls, table: Table, start_time: str = None, end_time: str = None
-    ) -> t.List:
+    ) -> t.Iterable:
         raise NotImplementedError
 
+    @classmethod
+    def get_count_from_time_range(
+        cls, table: Table, start_time: str = None, end_time: str = None
+    ) -> int:
+        """
+        Counts what get_from_time_range returns. Override where dynamodb can
+        do the counting.
+        """
+        return sum(1 for _ in cls.get_from_time_range(table, start_time, end_time))
+
 
 @dataclass
 class PipelinePDQHashRecord(PDQRecordBase):
@@ -315,30 +383,41 @@ class PDQMatchRecord(PDQRecordBase):
     @classmethod
     def get_from_time_range(
         cls, table: Table, start_time: str = None, end_time: str = None
-    ) -> t.List["PDQMatchRecord"]:
+    ) -> t.Iterator["PDQMatchRecord"]:
+        """
+        Lazily yields records, newest first, reading the table a page at a time
+        as the result is consumed.
+        """
         items = MatchRecordQuery.from_time_range(
             table, cls.get_dynamodb_type_key(cls.SIGNAL_TYPE), start_time, end_time
         )
-        return cls._result_items_to_records(items)
+        return (cls._result_item_to_record(item) for item in items)
+
+    @classmethod
+    def get_count_from_time_range(
+        cls, table: Table, start_time: str = None, end_time: str = None
+    ) -> int:
+        return MatchRecordQuery.count_from_time_range(
+            table, cls.get_dynamodb_type_key(cls.SIGNAL_TYPE), start_time, end_time
+        )
 
     @classmethod
     def _result_items_to_records(
         cls,
         items: t.List[t.Dict],
     ) -> t.List["PDQMatchRecord"]:
-        return [
-            PDQMatchRecord(
-                content_id=cls.remove_content_key_prefix(item["PK"]),
-                content_hash=item["ContentHash"],
-                updated_at=datetime.datetime.fromisoformat(item["UpdatedAt"]),
-                signal_id=cls.remove_signal_key_prefix(
-                    item["SK"], item["SignalSource"]
-                ),
-                signal_source=item["SignalSource"],
-                signal_hash=item["SignalHash"],
-            )
-            for item in items
-        ]
+        return [cls._result_item_to_record(item) for item in items]
+
+    @classmethod
+    def _result_item_to_record(cls, item: t.Dict) -> "PDQMatchRecord":
+        return PDQMatchRecord(
+            content_id=cls.remove_content_key_prefix(item["PK"]),
+            content_hash=item["ContentHash"],
+            updated_at=datetime.datetime.fromisoformat(item["UpdatedAt"]),
+            signal_id=cls.remove_signal_key_prefix(item["SK"], item["SignalSource"]),
+            signal_source=item["SignalSource"],
+            signal_hash=item["SignalHash"],
+        )
 
 
 class HashRecordQuery:
@@ -439,20 +518,53 @@ class MatchRecordQuery:
     @classmethod
     def from_time_range(
         cls, table: Table, hash_type: str, start_time: str = None, end_time: str = None
-    ) -> t.List[t.Dict]:
+    ) -> t.Iterator[t.Dict]:
         """
         Given a hash type and time range, give me all the matches found for that type and time range
+
+        Items are yielded newest first, page by page, so only one page of
+        results is held in memory at a time.
         """
+        paginator = table.meta.client.get_paginator("query")
+        response_iterator = paginator.paginate(
+            **cls._time_range_query_args(table, hash_type, start_time, end_time),
+            ProjectionExpression=cls.DEFAULT_PROJ_EXP,
+            # Newest first, so callers that stop early keep the latest matches
+            ScanIndexForward=False,
+        )
+        for page in response_iterator:
+            yield from page["Items"]
+
+    @classmethod
+    def count_from_time_range(
+        cls, table: Table, hash_type: str, start_time: str = None, end_time: str = None
+    ) -> int:
+        """
+        Given a hash type and time range, how many matches were found for that
+        type and time range. Only counts come back from dynamodb, not items.
+        """
+        paginator = table.meta.client.get_paginator("query")
+        response_iterator = paginator.paginate(
+            **cls._time_range_query_args(table, hash_type, start_time, end_time),
+            Select="COUNT",
+        )
+        return sum(page["Count"] for page in response_iterator)
+
+    @staticmethod
+    def _time_range_query_args(
+        table: Table, hash_type: str, start_time: str = None, end_time: str = None
+    ) -> t.Dict[str, t.Any]:
         if start_time is None:
             start_time = datetime.datetime.min.isoformat()
         if end_time is None:
             end_time = datetime.datetime.max.isoformat()
-        return table.query(
-            IndexName="GSI-2",
-            KeyConditionExpression=Key("GSI2-PK").eq(hash_type)
+        return {
+            "TableName": table.name,
+            "IndexName": "GSI-2",
+            # the table's client accepts resource style conditions
+            "KeyConditionExpression": Key("GSI2-PK").eq(hash_type)
             & Key("UpdatedAt").between(start_time, end_time),
-            ProjectionExpression=cls.DEFAULT_PROJ_EXP,
-        ).get("Items", [])
+        }
 
 
 @dataclass
@@ -473,15 +585,16 @@ class MatchMessage(AWSMessage):
     matching_banked_signals: t.List["BankedSignal"] = field(default_factory=list)
 
     def to_aws_message(self) -> str:
-        return json.dumps(
-            {
-                "ContentKey": self.content_key,
-                "ContentHash": self.content_hash,
-                "MatchingBankedSignals": [
-                    x.to_dict() for x in self.matching_banked_signals
-                ],
-            }
-        )
+        return json.dumps(self.to_aws_dict())
+
+    def to_aws_dict(self) -> t.Dict:
+        return {
+            "ContentKey": self.content_key,
+            "ContentHash": self.content_hash,
+            "MatchingBankedSignals": [
+                x.to_dict() for x in self.matching_banked_signals
+            ],
+        }
 
     @classmethod
     def from_aws_message(cls, message: str) -> "MatchMessage":
@@ -169,6 +169,23 @@ class TestPDQModels(unittest.TestCase):
 
         assert record == query_record
 
+    def test_count_hash_records_by_time(self):
+        """
+        Test PipelinePDQHashRecord write table with get_count_from_time_range
+        """
+
+        record = self.get_example_pdq_hash_record()
+
+        record.write_to_table(self.table)
+
+        assert models.PipelinePDQHashRecord.get_count_from_time_range(self.table) == 1
+        assert (
+            models.PipelinePDQHashRecord.get_count_from_time_range(
+                self.table, (record.updated_at + datetime.timedelta(1)).isoformat()
+            )
+            == 0
+        )
+
     def test_write_match_record(self):
         """
         Test PDQMatchRecord write table with hardcode query
@@ -227,10 +244,60 @@ class TestPDQModels(unittest.TestCase):
 
         record.write_to_table(self.table)
 
-        query_record = models.PDQMatchRecord.get_from_time_range(self.table)[0]
+        query_record = next(models.PDQMatchRecord.get_from_time_range(self.table))
 
         assert record == query_record
 
+    def test_query_match_records_by_time_newest_first(self):
+        """
+        Test PDQMatchRecord get_from_time_range yields the latest match first
+        """
+
+        start = datetime.datetime.now() + datetime.timedelta(10)
+        older = self.get_example_pdq_match_record()
+        older.content_id = "older-content-id"
+        older.updated_at = start + datetime.timedelta(1)
+        newer = self.get_example_pdq_match_record()
+        newer.content_id = "newer-content-id"
+        newer.updated_at = start + datetime.timedelta(2)
+
+        older.write_to_table(self.table)
+        newer.write_to_table(self.table)
+        try:
+            query_records = list(
+                models.PDQMatchRecord.get_from_time_range(self.table, start.isoformat())
+            )
+        finally:
+            # other tests count every match record in the shared table
+            for record in (older, newer):
+                self.table.delete_item(
+                    Key={
+                        "PK": record.get_dynamodb_content_key(record.content_id),
+                        "SK": record.get_dynamodb_signal_key(
+                            record.signal_source, record.signal_id
+                        ),
+                    }
+                )
+
+        assert [newer, older] == query_records
+
+    def test_count_match_records_by_time(self):
+        """
+        Test PDQMatchRecord write table with get_count_from_time_range
+        """
+
+        record = self.get_example_pdq_match_record()
+
+        record.write_to_table(self.table)
+
+        assert models.PDQMatchRecord.get_count_from_time_range(self.table) == 1
+        assert (
+            models.PDQMatchRecord.get_count_from_time_range(
+                self.table, (record.updated_at + datetime.timedelta(1)).isoformat()
+            )
+            == 0
+        )
+
     def test_pdq_signal_metadata_manually(self):
         """
         Test PDQSignalMetadata write table
@@ -267,6 +334,24 @@ class TestPDQModels(unittest.TestCase):
         for tag in metadata.tags:
             assert tag in query_metadata.tags
 
+    def test_pdq_signal_metadata_by_signals(self):
+        """
+        Test PDQSignalMetadata write table with get_from_signals
+        """
+        metadata = self.get_example_pdq_signal_metadata()
+
+        metadata.write_to_table(self.table)
+
+        signal = (TestPDQModels.TEST_SIGNAL_ID, TestPDQModels.TEST_SIGNAL_SOURCE)
+        missing_signal = ("0000000000000000", TestPDQModels.TEST_SIGNAL_SOURCE)
+        query_metadata = models.PDQSignalMetadata.get_from_signals(
+            self.table, [signal, missing_signal, signal]
+        )
+
+        assert set(query_metadata) == {signal, missing_signal}
+        assert query_metadata[missing_signal] == []
+        assert metadata.signal_hash == query_metadata[signal][0].signal_hash
+
     def test_pdq_signal_metadata_update_tags_in_table(self):
         """
         Test PDQSignalMetadata write to table with update_tags_in_table_if_exists
@@ -8,10 +8,11 @@ setup(
     name="hmalib",
     description="Convenience package for hmalib. Probably don't distribute it.",
     install_requires=[
-        "boto3",
+        "boto3>=1.28.81",
         "boto3-stubs[essential,sns]==1.17.14.0",
         "threatexchange[faiss,pdq_hasher]>=0.0.18",
         "bottle",
         "apig_wsgi",
+        "orjson",
     ],
 )
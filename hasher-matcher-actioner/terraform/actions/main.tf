@@ -49,30 +49,30 @@ resource "aws_sns_topic_subscription" "new_matches_topic" {
   endpoint  = aws_sqs_queue.matches_queue.arn
 }
 
-# Set up the queue for sending messages from the action evaluator to the action performer
+# Set up the queue for sending messages from the action evaluator to the reactioner
 
-resource "aws_sqs_queue" "actions_queue" {
-  name_prefix                = "${var.prefix}-actions"
+resource "aws_sqs_queue" "reactions_queue" {
+  name_prefix                = "${var.prefix}-reactions"
   visibility_timeout_seconds = 300
   message_retention_seconds  = 1209600
   tags = merge(
     var.additional_tags,
     {
-      Name = "ActionsQueue"
+      Name = "ReactionsQueue"
     }
   )
 }
 
-# Set up the queue for sending messages from the action evaluator to the reactioner
+# Action messages the action performer still failed on after Lambda's retries
+# of the asynchronous invocation.
 
-resource "aws_sqs_queue" "reactions_queue" {
-  name_prefix                = "${var.prefix}-reactions"
-  visibility_timeout_seconds = 300
-  message_retention_seconds  = 1209600
+resource "aws_sqs_queue" "action_performer_failures_queue" {
+  name_prefix               = "${var.prefix}-action-performer-failures"
+  message_retention_seconds = 1209600
   tags = merge(
     var.additional_tags,
     {
-      Name = "ReactionsQueue"
+      Name = "ActionPerformerFailuresQueue"
     }
   )
 }
@@ -96,13 +96,14 @@ resource "aws_lambda_function" "action_evaluator" {
 
   environment {
     variables = {
-      ACTIONS_QUEUE_URL = aws_sqs_queue.actions_queue.id,
+      ACTION_PERFORMER_FUNCTION_NAME = aws_lambda_function.action_performer.function_name,
       REACTIONS_QUEUE_URL = aws_sqs_queue.reactions_queue.id,
     }
   }
 }
 
-# Action performer performs actions decided on by the action evaluator.
+# Action performer performs actions decided on by the action evaluator. It is
+# invoked asynchronously by the action evaluator, once per action.
 
 resource "aws_lambda_function" "action_performer" {
   function_name = "${var.prefix}_action_performer"
@@ -118,6 +119,17 @@ resource "aws_lambda_function" "action_performer" {
   memory_size = 512
 }
 
+resource "aws_lambda_function_event_invoke_config" "action_performer" {
+  function_name          = aws_lambda_function.action_performer.function_name
+  maximum_retry_attempts = 2
+
+  destination_config {
+    on_failure {
+      destination = aws_sqs_queue.action_performer_failures_queue.arn
+    }
+  }
+}
+
 # Reactioner reacts to ThreatExchange.
 
 resource "aws_lambda_function" "reactioner" {
@@ -204,7 +216,12 @@ data "aws_iam_policy_document" "action_evaluator" {
   statement {
     effect    = "Allow"
     actions   = ["sqs:SendMessage"]
-    resources = [aws_sqs_queue.actions_queue.arn, aws_sqs_queue.reactions_queue.arn]
+    resources = [aws_sqs_queue.reactions_queue.arn]
+  }
+  statement {
+    effect    = "Allow"
+    actions   = ["lambda:InvokeFunction"]
+    resources = [aws_lambda_function.action_performer.arn]
   }
   statement {
     effect = "Allow"
@@ -241,11 +258,6 @@ resource "aws_iam_policy" "action_performer" {
 }
 
 data "aws_iam_policy_document" "action_performer" {
-  statement {
-    effect    = "Allow"
-    actions   = ["sqs:GetQueueAttributes", "sqs:ReceiveMessage", "sqs:DeleteMessage"]
-    resources = [aws_sqs_queue.actions_queue.arn]
-  }
   statement {
     effect = "Allow"
     actions = [
@@ -255,6 +267,11 @@ data "aws_iam_policy_document" "action_performer" {
     ]
     resources = ["${aws_cloudwatch_log_group.action_performer.arn}:*"]
   }
+  statement {
+    effect    = "Allow"
+    actions   = ["sqs:SendMessage"]
+    resources = [aws_sqs_queue.action_performer_failures_queue.arn]
+  }
   statement {
     effect    = "Allow"
     actions   = ["cloudwatch:PutMetricData"]
@@ -321,13 +338,6 @@ resource "aws_lambda_event_source_mapping" "matches_queue_to_action_evaluator" {
   maximum_batching_window_in_seconds = 30
 }
 
-resource "aws_lambda_event_source_mapping" "actions_queue_to_action_performer" {
-  event_source_arn                   = aws_sqs_queue.actions_queue.arn
-  function_name                      = aws_lambda_function.action_performer.arn
-  batch_size                         = 100
-  maximum_batching_window_in_seconds = 30
-}
-
 resource "aws_lambda_event_source_mapping" "reactions_queue_to_reactioner" {
   event_source_arn                   = aws_sqs_queue.reactions_queue.arn
   function_name                      = aws_lambda_function.reactioner.arn